@@ -1,6 +1,8 @@
 import requests, json, os, time, jwt, logging
 from datetime import datetime
 
+from messages import render
+
 # ===============================================
 # 🔗 Backend Endpoints (based on your Django setup)
 # ===============================================
@@ -26,31 +28,33 @@ def save_sessions():
 # ===============================================
 # 🧍‍♂️ Register a New User
 # ===============================================
-def register_user(**kwargs):
+def register_user(lang: str = "english", **kwargs):
     """
     Register a new Saarthi user using keyword arguments.
     Expected fields: email, username, password, first_name, last_name, etc.
+    Messages are returned in `lang`.
     """
     payload = kwargs  # directly use the passed dict
     try:
         resp = requests.post(REGISTER_URL, json=payload, timeout=10)
         if resp.status_code == 201:
-            return True, "🎉 Registration successful! You can now /login"
+            return True, render("register_success", lang)
         elif resp.status_code == 400:
-            return False, f"⚠️ Registration failed: {resp.json()}"
+            return False, render("register_failed", lang, details=resp.json())
         else:
-            return False, f"❌ Unexpected error: {resp.text}"
+            return False, render("register_unexpected_error", lang, details=resp.text)
     except Exception as e:
         logging.error(f"Registration error: {e}")
-        return False, "Server connection failed ❌"
+        return False, render("register_connection_failed", lang)
 
 
 # ===============================================
 # 🔑 Login (Obtain Tokens)
 # ===============================================
-def login_user(telegram_id: str, username: str, password: str):
+def login_user(telegram_id: str, username: str, password: str, lang: str = "english"):
     """
     Authenticate user and save access/refresh tokens.
+    Messages are returned in `lang`.
     """
     try:
         resp = requests.post(LOGIN_URL, json={"username": username, "password": password}, timeout=10)
@@ -62,14 +66,14 @@ def login_user(telegram_id: str, username: str, password: str):
                 "login_time": datetime.now().isoformat()
             }
             save_sessions()
-            return True, "✅ Login successful!"
+            return True, render("login_success", lang)
         elif resp.status_code == 401:
-            return False, "❌ Invalid credentials"
+            return False, render("login_invalid", lang)
         else:
-            return False, f"⚠️ Login failed: {resp.text}"
+            return False, render("login_failed", lang, details=resp.text)
     except Exception as e:
         logging.error(f"Login error: {e}")
-        return False, "Server connection error ❌"
+        return False, render("login_connection_error", lang)
 
 # ===============================================
 # ♻️ Refresh Access Token
@@ -1,13 +1,43 @@
 import json, os
 
 CONFIG_PATH = "config.json"
+USER_LANGUAGES_FILE = "user_languages.json"  # per-user choices; user data, not tracked in git
+DEFAULT_LANGUAGE = "english"
 
-def get_language():
-    if not os.path.exists(CONFIG_PATH):
-        return "english"
-    with open(CONFIG_PATH, "r") as f:
-        return json.load(f).get("language", "english")
+# Loaded once on first use and kept in memory, so replies never hit the disk
+_config = None
+_user_languages = None
 
-def set_language(lang):
-    with open(CONFIG_PATH, "w") as f:
-        json.dump({"language": lang}, f)
+def _load_json(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+def _load():
+    global _config, _user_languages
+    if _config is None:
+        _config = _load_json(CONFIG_PATH)
+        _user_languages = _load_json(USER_LANGUAGES_FILE)
+    return _config, _user_languages
+
+def get_language(telegram_id=None):
+    """Language chosen by this user, else the bot-wide default."""
+    config, user_languages = _load()
+    if telegram_id is not None:
+        lang = user_languages.get(str(telegram_id))
+        if lang:
+            return lang
+    return config.get("language", DEFAULT_LANGUAGE)
+
+def set_language(lang, telegram_id=None):
+    """Set the language for one user, or the bot-wide default without an id."""
+    config, user_languages = _load()
+    if telegram_id is None:
+        config["language"] = lang
+        path, data = CONFIG_PATH, config
+    else:
+        user_languages[str(telegram_id)] = lang
+        path, data = USER_LANGUAGES_FILE, user_languages
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
@@ -0,0 +1,148 @@
+import asyncio, logging, time
+from collections import deque
+
+# ===============================================
+# ⏱️ Hedging Settings
+# ===============================================
+LATENCY_WINDOW = 200        # recent calls kept per model
+MIN_SAMPLES = 20            # below this we don't trust the p95 / hedge rate yet
+DEFAULT_HEDGE_DELAY = 4.0   # seconds to wait before hedging while we lack samples
+MIN_HEDGE_DELAY = 0.5       # never hedge sooner than this, even for a fast model
+MAX_HEDGE_RATE = 0.1        # stop hedging a model once this share of its calls hedged
+MODEL_TIMEOUT = 15.0        # give up on a model (and fall back) after this long
+
+
+# ===============================================
+# 📊 Per-model Latency Tracking
+# ===============================================
+class LatencyTracker:
+    """Rolling window of call latencies and hedge decisions for one model."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.samples = deque(maxlen=window)
+        self.hedges = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        """Add a latency; cancelled calls pass their elapsed time as a lower bound."""
+        self.samples.append(seconds)
+
+    def record_hedge(self, hedged: bool):
+        self.hedges.append(hedged)
+
+    def p95(self):
+        """Return the 95th percentile latency, or None with too few samples."""
+        if len(self.samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def hedge_rate(self) -> float:
+        if len(self.hedges) < MIN_SAMPLES:
+            return 0.0
+        return sum(self.hedges) / len(self.hedges)
+
+
+# ===============================================
+# 🤖 Hedged Client with Model Fallback
+# ===============================================
+class GeminiClient:
+    """
+    Wraps an ordered list of model backends.
+    Each backend needs `generate_content(prompt)` returning an object with
+    `.text`; `generate_content_async` is used instead when present. Once a
+    call outlives the model's observed p95, a hedge is sent to the next
+    untried model in the list (or the same model when none is left); the
+    first answer wins and the other is cancelled. When a model fails, the
+    next model not yet called (directly or as a hedge) is tried.
+    """
+
+    def __init__(self, models, default_hedge_delay: float = DEFAULT_HEDGE_DELAY,
+                 min_hedge_delay: float = MIN_HEDGE_DELAY, max_hedge_rate: float = MAX_HEDGE_RATE,
+                 timeout: float = MODEL_TIMEOUT):
+        if not models:
+            raise ValueError("GeminiClient needs at least one model")
+        self.models = list(models)
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_rate = max_hedge_rate
+        self.timeout = timeout
+        self.latency = {model_name(m): LatencyTracker() for m in self.models}
+
+    def hedge_delay(self, model):
+        """Seconds to wait before hedging, or None when the hedge budget is spent."""
+        tracker = self.latency[model_name(model)]
+        if tracker.hedge_rate() >= self.max_hedge_rate:
+            return None
+        p95 = tracker.p95()
+        if p95 is None:
+            return self.default_hedge_delay
+        return max(p95, self.min_hedge_delay)
+
+    async def generate(self, prompt: str) -> str:
+        """Return the response text from the first model that succeeds."""
+        last_error = None
+        tried = set()  # models already called, directly or as a hedge
+        for i, model in enumerate(self.models):
+            if model_name(model) in tried:
+                continue
+            backup = next((m for m in self.models[i + 1:] if model_name(m) not in tried), model)
+            try:
+                return await asyncio.wait_for(self._hedged(model, backup, prompt, tried), self.timeout)
+            except Exception as e:
+                last_error = e
+                logging.warning(f"Gemini model {model_name(model)} failed: {e!r}")
+        raise RuntimeError(f"All Gemini models failed: {last_error!r}")
+
+    async def _hedged(self, model, backup, prompt: str, tried: set) -> str:
+        tried.add(model_name(model))
+        first = asyncio.ensure_future(self._timed(model, prompt, censor=True))
+        pending = {first}
+        hedged = False
+        try:
+            delay = self.hedge_delay(model)
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return first.result()
+
+            hedged = True
+            tried.add(model_name(backup))
+            logging.info(f"Hedging slow Gemini call to {model_name(model)} with {model_name(backup)}")
+            pending.add(asyncio.ensure_future(self._timed(backup, prompt, censor=False)))
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            self.latency[model_name(model)].record_hedge(hedged)
+            for task in pending:
+                task.cancel()
+
+    async def _timed(self, model, prompt: str, censor: bool) -> str:
+        """
+        Call the model and record its latency. With `censor`, a cancelled call
+        still records its elapsed time; only the original call sets it, since
+        it outlived the hedge delay, while a cancelled hedge says nothing
+        about the model's real latency.
+        """
+        started = time.monotonic()
+        tracker = self.latency[model_name(model)]
+        try:
+            if hasattr(model, "generate_content_async"):
+                response = await model.generate_content_async(prompt)
+            else:
+                response = await asyncio.to_thread(model.generate_content, prompt)
+        except asyncio.CancelledError:
+            # The real latency is at least this long; dropping it would bias p95 low
+            if censor:
+                tracker.record(time.monotonic() - started)
+            raise
+        tracker.record(time.monotonic() - started)
+        return response.text
+
+
+def model_name(model) -> str:
+    return getattr(model, "model_name", None) or type(model).__name__
@@ -1,6 +1,7 @@
 from telegram import Update, KeyboardButton, ReplyKeyboardMarkup,ReplyKeyboardRemove
 from telegram.ext import ApplicationBuilder, CommandHandler, MessageHandler, filters, ContextTypes,ConversationHandler
 import google.generativeai as genai
+import asyncio
 import json
 import logging
 import requests  # <-- for sending data to Django
@@ -8,6 +9,11 @@ import requests  # <-- for sending data to Django
 
 from auth_manage import register_user, login_user, logout_user, get_auth_header
 from voice_mode import handle_voice_report, handle_location2
+from photo_mode import fetch_photo_url, photo_upload_url
+from gemini_client import GeminiClient
+from messages import render
+import report_format
+from report_format import format_report_with_gemini, split_localized
 
 
 
@@ -29,15 +35,24 @@ logging.basicConfig(
     level=logging.INFO
 )
 
-# Initialize Gemini
+# Initialize Gemini (first model is preferred, the rest are fallbacks)
+GEMINI_MODELS = [
+    name.strip()
+    for name in os.getenv("GEMINI_MODELS", "gemini-2.5-flash,gemini-2.5-flash-lite").split(",")
+    if name.strip()
+]
 genai.configure(api_key=GEMINI_API_KEY)
-gemini_model = genai.GenerativeModel("gemini-2.5-flash")
+report_format.gemini_client = GeminiClient([genai.GenerativeModel(name) for name in GEMINI_MODELS])
 
 
 from config_utils import get_language, set_language
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import CallbackQueryHandler
 
+def tr(update: Update, key: str, **kwargs) -> str:
+    """Render a catalog reply in the language of the user behind `update`."""
+    return render(key, get_language(update.effective_user.id), **kwargs)
+
 async def setlang(update: Update, context: ContextTypes.DEFAULT_TYPE):
     keyboard = [[
         InlineKeyboardButton("🇬🇧 English", callback_data="lang_english"),
@@ -45,7 +60,7 @@ async def setlang(update: Update, context: ContextTypes.DEFAULT_TYPE):
         InlineKeyboardButton("🔀 Hinglish", callback_data="lang_hinglish"),
     ]]
     reply_markup = InlineKeyboardMarkup(keyboard)
-    await update.message.reply_text("🌐 Choose bot language mode:", reply_markup=reply_markup)
+    await update.message.reply_text(tr(update, "choose_language"), reply_markup=reply_markup)
 
 async def setlang_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
@@ -57,111 +72,109 @@ async def setlang_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "lang_hinglish": "hinglish"
     }
     lang = mapping.get(query.data, "english")
-    set_language(lang)
-    await query.edit_message_text(f"✅ Language mode set to *{lang}*", parse_mode="Markdown")
+    set_language(lang, update.effective_user.id)
+    await query.edit_message_text(tr(update, "language_set", lang=lang), parse_mode="Markdown")
 
 
 
 
-# ============================================================
-# Gemini: Convert report text to JSON
-# ============================================================
-def format_report_with_gemini(user_text: str, lat: float = 0.0, lon: float = 0.0) -> dict | None:
-    """Generate structured JSON using Gemini."""
-    prompt = f"""
-    You are a strict JSON generator for a Django backend model called AccessibilityReport.
-
-    Convert the user’s message into valid JSON with these fields:
-    {{
-      "latitude": <float>,  
-      "longitude": <float>, 
-      "problem_type": <string>,  
-      "disability_types": <list of strings>, 
-      "severity": <string>,  
-      "description": <string>, 
-      "photo_url": <string or null>,  
-      "status": <string>
-    }}
-
-    Rules:
-    - Output only valid JSON, no markdown or text.
-    - Use provided coordinates if available: latitude={lat}, longitude={lon}.
-    - Default severity='Medium', photo_url=null, status='Active'.
-
-    User report: "{user_text}"
-    """
-
-    try:
-        response = gemini_model.generate_content(prompt)
-        raw = response.text.strip().strip("```json").strip("```").strip()
-        return json.loads(raw)
-    except Exception as e:
-        logging.error(f"Gemini JSON error: {e}")
-        return None
-
-
 # ============================================================
 # Telegram Handlers
 # ============================================================
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text(
-        "In your service, my lord 👑\n\n"
-        "Use /sendlocation to share your current location first, "
-        "then use /submitreport <description>."
-    )
+    await update.message.reply_text(tr(update, "start"))
 
 
 
 async def submitreport(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not context.args:
-        await update.message.reply_text("Usage: /submitreport <your report text>")
+        await update.message.reply_text(tr(update, "submit_usage"))
         return
 
     lat = context.user_data.get("latitude", 0.0)
     lon = context.user_data.get("longitude", 0.0)
     user_text = " ".join(context.args)
 
-    await update.message.reply_text("Analyzing your report with Gemini... 🧠")
+    await update.message.reply_text(tr(update, "analyzing"))
 
-    report = format_report_with_gemini(user_text, lat, lon)
+    report = await format_report_with_gemini(user_text, lat, lon, get_language(update.effective_user.id))
     if not report:
-        await update.message.reply_text("⚠️ Gemini failed to process your report.")
+        await update.message.reply_text(tr(update, "gemini_failed"))
         return
 
     # ✅ Get auth header for this Telegram user
     headers = get_auth_header(update.effective_user.id)
     if not headers:
-        await update.message.reply_text("⚠️ You are not logged in. Please /login first.")
+        await update.message.reply_text(tr(update, "not_logged_in"))
         return
 
+    await send_report_to_backend(update, report, headers)
+
+
+async def send_report_to_backend(update: Update, report: dict, headers: dict):
+    """POST a formatted report to the backend and tell the user how it went."""
+    report, localized = split_localized(report)
     # ===============================================
     # 🛰️ Step 2: Send to Django Backend API
     # ===============================================
     try:
         resp = requests.post(API_URL, headers=headers, json=report, timeout=10)
         if resp.status_code in [200, 201]:
-            await update.message.reply_text("✅ Report successfully submitted to the backend!")
+            await update.message.reply_text(tr(update, "report_submitted"))
         else:
             await update.message.reply_text(
-                f"⚠️ Failed to send report (status {resp.status_code}):\n{resp.text[:200]}"
+                tr(update, "report_failed", status=resp.status_code, details=resp.text[:200])
             )
 
     except Exception as e:
         logging.error(f"Backend POST error: {e}")
-        await update.message.reply_text("❌ Error sending report to the backend.")
+        await update.message.reply_text(tr(update, "report_error"))
+
+    if localized:
+        await update.message.reply_text(tr(update, "localized_description", description=localized))
 
     # Optional debug output
     formatted = json.dumps(report, indent=2)
-    await update.message.reply_text(
-        f"📦 Sent JSON:\n```json\n{formatted}\n```", parse_mode="Markdown"
+    await update.message.reply_text(tr(update, "sent_json", json=formatted), parse_mode="Markdown")
+
+
+async def photoreport(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Submit a report from a photo; the caption is the report text."""
+    user_text = update.message.caption
+    if not user_text:
+        await update.message.reply_text(tr(update, "photo_caption_missing"))
+        return
+
+    headers = get_auth_header(update.effective_user.id)
+    if not headers:
+        await update.message.reply_text(tr(update, "not_logged_in"))
+        return
+
+    lat = context.user_data.get("latitude", 0.0)
+    lon = context.user_data.get("longitude", 0.0)
+
+    await update.message.reply_text(tr(update, "analyzing"))
+
+    # Photo upload runs alongside Gemini so it adds no extra wait
+    report, photo_url = await asyncio.gather(
+        format_report_with_gemini(user_text, lat, lon, get_language(update.effective_user.id)),
+        fetch_photo_url(update.message.photo, headers),
     )
+    if not report:
+        await update.message.reply_text(tr(update, "gemini_failed"))
+        return
+    if photo_upload_url() and not photo_url:
+        await update.message.reply_text(tr(update, "photo_upload_failed"))
+    report["photo_url"] = photo_url
+
+    await send_report_to_backend(update, report, headers)
 
 
 async def sendlocation(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Ask user to share their current GPS location."""
-    keyboard = [[KeyboardButton("📍 Send my location", request_location=True)]]
+    keyboard = [[KeyboardButton(tr(update, "location_button"), request_location=True)]]
     reply_markup = ReplyKeyboardMarkup(keyboard, one_time_keyboard=True, resize_keyboard=True)
-    await update.message.reply_text("Please share your current location:", reply_markup=reply_markup)
+    await update.message.reply_text(tr(update, "location_prompt"), reply_markup=reply_markup)
 
 async def handle_location(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Save the user's sent location."""
@@ -169,9 +182,11 @@ async def handle_location(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if user_location:
         context.user_data["latitude"] = user_location.latitude
         context.user_data["longitude"] = user_location.longitude
-        await update.message.reply_text(f"📍 Location saved: ({user_location.latitude:.4f}, {user_location.longitude:.4f})")
+        await update.message.reply_text(
+            tr(update, "location_saved", lat=user_location.latitude, lon=user_location.longitude)
+        )
     else:
-        await update.message.reply_text("❌ Failed to get location, please try again.")
+        await update.message.reply_text(tr(update, "location_failed"))
 
 # async def submitreport(update: Update, context: ContextTypes.DEFAULT_TYPE):
 #     if not context.args:
@@ -227,19 +242,20 @@ async def handle_location(update: Update, context: ContextTypes.DEFAULT_TYPE):
 # /login <email> <password>
 async def login(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if len(context.args) < 2:
-        await update.message.reply_text("Usage: /login <username> <password>")
+        await update.message.reply_text(tr(update, "login_usage"))
         return
     username, password = context.args[0], context.args[1]
-    ok, msg = login_user(update.effective_user.id, username, password)
+    ok, msg = login_user(update.effective_user.id, username, password,
+                         lang=get_language(update.effective_user.id))
     await update.message.reply_text(msg)
 
 
 # /logout
 async def logout(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if logout_user(update.effective_user.id):
-        await update.message.reply_text("👋 Logged out successfully.")
+        await update.message.reply_text(tr(update, "logout_success"))
     else:
-        await update.message.reply_text("⚠️ You are not logged in.")
+        await update.message.reply_text(tr(update, "logout_not_logged_in"))
 
 
 
@@ -254,37 +270,34 @@ async def logout(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def start_registration(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text(
-        "👋 Let's create your Saarthi account!\nWhat's your *first name*?",
-        parse_mode="Markdown"
-    )
+    await update.message.reply_text(tr(update, "reg_first_name"), parse_mode="Markdown")
     return FIRST_NAME
 
 async def first_name(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data["first_name"] = update.message.text
-    await update.message.reply_text("Great! Now your *last name*?", parse_mode="Markdown")
+    await update.message.reply_text(tr(update, "reg_last_name"), parse_mode="Markdown")
     return LAST_NAME
 
 async def last_name(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data["last_name"] = update.message.text
-    await update.message.reply_text("Enter your *email* address:")
+    await update.message.reply_text(tr(update, "reg_email"))
     return EMAIL
 
 async def email(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data["email"] = update.message.text
-    await update.message.reply_text("Set a *password* (min 6 chars):", parse_mode="Markdown")
+    await update.message.reply_text(tr(update, "reg_password"), parse_mode="Markdown")
     return PASSWORD
 
 
 async def confirm_password(update: Update, context: ContextTypes.DEFAULT_TYPE):
     confirm = update.message.text
     if confirm != context.user_data["password"]:
-        await update.message.reply_text("⚠️ Passwords don't match. Please enter your password again:")
+        await update.message.reply_text(tr(update, "reg_password_mismatch"))
         return PASSWORD
     context.user_data["password_confirm"] = confirm
     keyboard = [["user", "volunteer"]]
     await update.message.reply_text(
-        "Choose your *user type*:",
+        tr(update, "reg_user_type"),
         parse_mode="Markdown",
         reply_markup=ReplyKeyboardMarkup(keyboard, one_time_keyboard=True, resize_keyboard=True)
     )
@@ -292,33 +305,33 @@ async def confirm_password(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def password(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data["password"] = update.message.text
-    await update.message.reply_text("Please confirm your password:")
+    await update.message.reply_text(tr(update, "reg_confirm_password"))
     return CONFIRM_PASSWORD
 
 async def user_type(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data["user_type"] = update.message.text
     keyboard = [["Yes", "No"]]
-    await update.message.reply_text("Do you need *wheelchair access*?", parse_mode="Markdown",
+    await update.message.reply_text(tr(update, "reg_wheelchair"), parse_mode="Markdown",
                                     reply_markup=ReplyKeyboardMarkup(keyboard, one_time_keyboard=True))
     return WHEELCHAIR
 
 async def wheelchair(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data["needs_wheelchair_access"] = update.message.text.lower() == "yes"
     keyboard = [["Yes", "No"]]
-    await update.message.reply_text("Do you need *tactile paths*?", parse_mode="Markdown",
+    await update.message.reply_text(tr(update, "reg_tactile"), parse_mode="Markdown",
                                     reply_markup=ReplyKeyboardMarkup(keyboard, one_time_keyboard=True))
     return TACTILE
 
 async def tactile(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data["needs_tactile_paths"] = update.message.text.lower() == "yes"
     keyboard = [["Yes", "No"]]
-    await update.message.reply_text("Do you need *audio guidance*?", parse_mode="Markdown",
+    await update.message.reply_text(tr(update, "reg_audio"), parse_mode="Markdown",
                                     reply_markup=ReplyKeyboardMarkup(keyboard, one_time_keyboard=True))
     return AUDIO
 
 async def audio(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data["needs_audio_guidance"] = update.message.text.lower() == "yes"
-    await update.message.reply_text("📝 Submitting your registration...", reply_markup=ReplyKeyboardRemove())
+    await update.message.reply_text(tr(update, "reg_submitting"), reply_markup=ReplyKeyboardRemove())
 
     data = {
         "username": context.user_data["email"].split("@")[0],
@@ -335,14 +348,11 @@ async def audio(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "disability_type": "none"
     }
 
-    ok, msg = register_user(**data)
+    ok, msg = register_user(lang=get_language(update.effective_user.id), **data)
 
     if ok:
         username = data["username"]
-        await update.message.reply_text(
-            f"🎉 Registration successful!\nYou can now /login with username: *{username}*",
-            parse_mode="Markdown"
-        )
+        await update.message.reply_text(tr(update, "reg_success", username=username), parse_mode="Markdown")
     else:
         await update.message.reply_text(msg)
 
@@ -350,7 +360,7 @@ async def audio(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def cancel_registration(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text("❌ Registration canceled.", reply_markup=ReplyKeyboardRemove())
+    await update.message.reply_text(tr(update, "reg_canceled"), reply_markup=ReplyKeyboardRemove())
     return ConversationHandler.END
 
 registration_conversation = ConversationHandler(
@@ -386,6 +396,7 @@ app.add_handler(CommandHandler("submitreport", submitreport))
 app.add_handler(CommandHandler("login", login))
 app.add_handler(CommandHandler("logout", logout))
 app.add_handler(MessageHandler(filters.VOICE & ~filters.COMMAND, handle_voice_report))
+app.add_handler(MessageHandler(filters.PHOTO, photoreport))
 app.add_handler(CommandHandler("setlang", setlang))
 app.add_handler(CallbackQueryHandler(setlang_callback))
 
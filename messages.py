@@ -0,0 +1,270 @@
+from string import Formatter
+
+# ===============================================
+# 🌐 Reply Templates (english is the fallback)
+# ===============================================
+LANGUAGES = ("english", "hindi", "hinglish")
+DEFAULT_LANGUAGE = "english"
+
+MESSAGES = {
+    "choose_language": {
+        "english": "🌐 Choose bot language mode:",
+        "hindi": "🌐 बॉट की भाषा चुनें:",
+        "hinglish": "🌐 Bot ki language choose karein:",
+    },
+    "language_set": {
+        "english": "✅ Language mode set to *{lang}*",
+        "hindi": "✅ भाषा *{lang}* पर सेट कर दी गई है",
+        "hinglish": "✅ Language *{lang}* set ho gayi hai",
+    },
+    "start": {
+        "english": (
+            "In your service, my lord 👑\n\n"
+            "Use /sendlocation to share your current location first, "
+            "then use /submitreport <description>.\n"
+            "You can also send a photo with the description as its caption."
+        ),
+        "hindi": (
+            "आपकी सेवा में, मालिक 👑\n\n"
+            "पहले /sendlocation से अपनी मौजूदा लोकेशन भेजें, "
+            "फिर /submitreport <विवरण> का उपयोग करें।\n"
+            "आप विवरण को कैप्शन बनाकर फ़ोटो भी भेज सकते हैं।"
+        ),
+        "hinglish": (
+            "Aapki seva mein, maalik 👑\n\n"
+            "Pehle /sendlocation se apni current location bhejein, "
+            "phir /submitreport <description> use karein.\n"
+            "Aap description ko caption bana kar photo bhi bhej sakte hain."
+        ),
+    },
+    "submit_usage": {
+        "english": "Usage: /submitreport <your report text>",
+        "hindi": "उपयोग: /submitreport <आपकी रिपोर्ट>",
+        "hinglish": "Usage: /submitreport <aapki report>",
+    },
+    "analyzing": {
+        "english": "Analyzing your report with Gemini... 🧠",
+        "hindi": "Gemini से आपकी रिपोर्ट का विश्लेषण हो रहा है... 🧠",
+        "hinglish": "Gemini aapki report analyze kar raha hai... 🧠",
+    },
+    "gemini_failed": {
+        "english": "⚠️ Gemini failed to process your report.",
+        "hindi": "⚠️ Gemini आपकी रिपोर्ट प्रोसेस नहीं कर सका।",
+        "hinglish": "⚠️ Gemini aapki report process nahi kar paya.",
+    },
+    "not_logged_in": {
+        "english": "⚠️ You are not logged in. Please /login first.",
+        "hindi": "⚠️ आप लॉग इन नहीं हैं। कृपया पहले /login करें।",
+        "hinglish": "⚠️ Aap logged in nahi hain. Pehle /login karein.",
+    },
+    "report_submitted": {
+        "english": "✅ Report successfully submitted to the backend!",
+        "hindi": "✅ रिपोर्ट सफलतापूर्वक जमा हो गई!",
+        "hinglish": "✅ Report successfully submit ho gayi!",
+    },
+    "report_failed": {
+        "english": "⚠️ Failed to send report (status {status}):\n{details}",
+        "hindi": "⚠️ रिपोर्ट भेजने में विफल (status {status}):\n{details}",
+        "hinglish": "⚠️ Report bhejne mein problem hui (status {status}):\n{details}",
+    },
+    "report_error": {
+        "english": "❌ Error sending report to the backend.",
+        "hindi": "❌ रिपोर्ट भेजते समय त्रुटि हुई।",
+        "hinglish": "❌ Report bhejte waqt error aaya.",
+    },
+    "localized_description": {
+        "english": "📝 {description}",
+        "hindi": "📝 विवरण: {description}",
+        "hinglish": "📝 Description: {description}",
+    },
+    "sent_json": {
+        "english": "📦 Sent JSON:\n```json\n{json}\n```",
+        "hindi": "📦 भेजा गया JSON:\n```json\n{json}\n```",
+        "hinglish": "📦 Bheja gaya JSON:\n```json\n{json}\n```",
+    },
+    "photo_caption_missing": {
+        "english": "Please add a caption describing the issue to your photo.",
+        "hindi": "कृपया फ़ोटो के साथ समस्या का विवरण कैप्शन में लिखें।",
+        "hinglish": "Please photo ke caption mein problem describe karein.",
+    },
+    "photo_upload_failed": {
+        "english": "⚠️ Couldn't upload your photo, sending the report without it.",
+        "hindi": "⚠️ फ़ोटो अपलोड नहीं हो सकी, रिपोर्ट बिना फ़ोटो के भेजी जा रही है।",
+        "hinglish": "⚠️ Photo upload nahi ho payi, report bina photo ke bhej rahe hain.",
+    },
+    "location_button": {
+        "english": "📍 Send my location",
+        "hindi": "📍 मेरी लोकेशन भेजें",
+        "hinglish": "📍 Meri location bhejo",
+    },
+    "location_prompt": {
+        "english": "Please share your current location:",
+        "hindi": "कृपया अपनी मौजूदा लोकेशन साझा करें:",
+        "hinglish": "Please apni current location share karein:",
+    },
+    "location_saved": {
+        "english": "📍 Location saved: ({lat:.4f}, {lon:.4f})",
+        "hindi": "📍 लोकेशन सेव हो गई: ({lat:.4f}, {lon:.4f})",
+        "hinglish": "📍 Location save ho gayi: ({lat:.4f}, {lon:.4f})",
+    },
+    "location_failed": {
+        "english": "❌ Failed to get location, please try again.",
+        "hindi": "❌ लोकेशन नहीं मिली, कृपया फिर से कोशिश करें।",
+        "hinglish": "❌ Location nahi mili, please dobara try karein.",
+    },
+    "login_usage": {
+        "english": "Usage: /login <username> <password>",
+        "hindi": "उपयोग: /login <username> <password>",
+        "hinglish": "Usage: /login <username> <password>",
+    },
+    "login_success": {
+        "english": "✅ Login successful!",
+        "hindi": "✅ लॉग इन सफल!",
+        "hinglish": "✅ Login ho gaya!",
+    },
+    "login_invalid": {
+        "english": "❌ Invalid credentials",
+        "hindi": "❌ गलत यूज़रनेम या पासवर्ड",
+        "hinglish": "❌ Username ya password galat hai",
+    },
+    "login_failed": {
+        "english": "⚠️ Login failed: {details}",
+        "hindi": "⚠️ लॉग इन विफल: {details}",
+        "hinglish": "⚠️ Login fail ho gaya: {details}",
+    },
+    "login_connection_error": {
+        "english": "Server connection error ❌",
+        "hindi": "सर्वर से कनेक्शन में त्रुटि ❌",
+        "hinglish": "Server se connection mein error ❌",
+    },
+    "logout_success": {
+        "english": "👋 Logged out successfully.",
+        "hindi": "👋 आप सफलतापूर्वक लॉग आउट हो गए।",
+        "hinglish": "👋 Logout ho gaya.",
+    },
+    "logout_not_logged_in": {
+        "english": "⚠️ You are not logged in.",
+        "hindi": "⚠️ आप लॉग इन नहीं हैं।",
+        "hinglish": "⚠️ Aap logged in nahi hain.",
+    },
+    "reg_first_name": {
+        "english": "👋 Let's create your Saarthi account!\nWhat's your *first name*?",
+        "hindi": "👋 चलिए आपका Saarthi अकाउंट बनाते हैं!\nआपका *पहला नाम* क्या है?",
+        "hinglish": "👋 Chaliye aapka Saarthi account banate hain!\nAapka *first name* kya hai?",
+    },
+    "reg_last_name": {
+        "english": "Great! Now your *last name*?",
+        "hindi": "बढ़िया! अब आपका *उपनाम*?",
+        "hinglish": "Badhiya! Ab aapka *last name*?",
+    },
+    "reg_email": {
+        "english": "Enter your *email* address:",
+        "hindi": "अपना *ईमेल* पता दर्ज करें:",
+        "hinglish": "Apna *email* address daalein:",
+    },
+    "reg_password": {
+        "english": "Set a *password* (min 6 chars):",
+        "hindi": "एक *पासवर्ड* सेट करें (कम से कम 6 अक्षर):",
+        "hinglish": "Ek *password* set karein (kam se kam 6 characters):",
+    },
+    "reg_password_mismatch": {
+        "english": "⚠️ Passwords don't match. Please enter your password again:",
+        "hindi": "⚠️ पासवर्ड मेल नहीं खाते। कृपया पासवर्ड फिर से दर्ज करें:",
+        "hinglish": "⚠️ Passwords match nahi hue. Please password dobara daalein:",
+    },
+    "reg_confirm_password": {
+        "english": "Please confirm your password:",
+        "hindi": "कृपया अपने पासवर्ड की पुष्टि करें:",
+        "hinglish": "Please apna password confirm karein:",
+    },
+    "reg_user_type": {
+        "english": "Choose your *user type*:",
+        "hindi": "अपना *यूज़र टाइप* चुनें:",
+        "hinglish": "Apna *user type* choose karein:",
+    },
+    "reg_wheelchair": {
+        "english": "Do you need *wheelchair access*?",
+        "hindi": "क्या आपको *व्हीलचेयर एक्सेस* चाहिए?",
+        "hinglish": "Kya aapko *wheelchair access* chahiye?",
+    },
+    "reg_tactile": {
+        "english": "Do you need *tactile paths*?",
+        "hindi": "क्या आपको *टैक्टाइल पाथ* चाहिए?",
+        "hinglish": "Kya aapko *tactile paths* chahiye?",
+    },
+    "reg_audio": {
+        "english": "Do you need *audio guidance*?",
+        "hindi": "क्या आपको *ऑडियो गाइडेंस* चाहिए?",
+        "hinglish": "Kya aapko *audio guidance* chahiye?",
+    },
+    "reg_submitting": {
+        "english": "📝 Submitting your registration...",
+        "hindi": "📝 आपका रजिस्ट्रेशन जमा हो रहा है...",
+        "hinglish": "📝 Aapka registration submit ho raha hai...",
+    },
+    "reg_success": {
+        "english": "🎉 Registration successful!\nYou can now /login with username: *{username}*",
+        "hindi": "🎉 रजिस्ट्रेशन सफल!\nअब आप username *{username}* से /login कर सकते हैं",
+        "hinglish": "🎉 Registration ho gaya!\nAb aap username *{username}* se /login kar sakte hain",
+    },
+    "register_success": {
+        "english": "🎉 Registration successful! You can now /login",
+        "hindi": "🎉 रजिस्ट्रेशन सफल! अब आप /login कर सकते हैं",
+        "hinglish": "🎉 Registration ho gaya! Ab aap /login kar sakte hain",
+    },
+    "register_failed": {
+        "english": "⚠️ Registration failed: {details}",
+        "hindi": "⚠️ रजिस्ट्रेशन विफल: {details}",
+        "hinglish": "⚠️ Registration fail ho gaya: {details}",
+    },
+    "register_unexpected_error": {
+        "english": "❌ Unexpected error: {details}",
+        "hindi": "❌ अनपेक्षित त्रुटि: {details}",
+        "hinglish": "❌ Unexpected error: {details}",
+    },
+    "register_connection_failed": {
+        "english": "Server connection failed ❌",
+        "hindi": "सर्वर से कनेक्शन विफल ❌",
+        "hinglish": "Server se connection fail ho gaya ❌",
+    },
+    "reg_canceled": {
+        "english": "❌ Registration canceled.",
+        "hindi": "❌ रजिस्ट्रेशन रद्द कर दिया गया।",
+        "hinglish": "❌ Registration cancel ho gaya.",
+    },
+}
+
+
+# ===============================================
+# ⚙️ Compile Once at Startup
+# ===============================================
+def compile_catalog(messages: dict) -> dict:
+    """
+    Flatten the templates into a {(key, language): template} table.
+    Missing translations fall back to english, and every translation
+    must use the same placeholders as its english template.
+    """
+    catalog = {}
+    for key, templates in messages.items():
+        if DEFAULT_LANGUAGE not in templates:
+            raise ValueError(f"Message '{key}' has no {DEFAULT_LANGUAGE} template")
+        expected = _placeholders(templates[DEFAULT_LANGUAGE])
+        for lang in LANGUAGES:
+            template = templates.get(lang, templates[DEFAULT_LANGUAGE])
+            if _placeholders(template) != expected:
+                raise ValueError(f"Message '{key}' ({lang}) placeholders differ from {DEFAULT_LANGUAGE}")
+            catalog[(key, lang)] = template
+    return catalog
+
+
+def _placeholders(template: str) -> set:
+    return {field for _, field, _, _ in Formatter().parse(template) if field}
+
+
+CATALOG = compile_catalog(MESSAGES)
+
+
+def render(key: str, lang: str = DEFAULT_LANGUAGE, **kwargs) -> str:
+    """Return the reply for `key` in `lang`, falling back to english."""
+    template = CATALOG.get((key, lang)) or CATALOG[(key, DEFAULT_LANGUAGE)]
+    return template.format(**kwargs) if kwargs else template
@@ -0,0 +1,165 @@
+import asyncio, io, logging, os
+from collections import OrderedDict
+
+import requests
+from PIL import Image
+
+# ===============================================
+# 📷 Photo Pipeline Settings
+# ===============================================
+TARGET_SIDE = 640                  # longest side of the thumbnail, in px
+THUMBNAIL_QUALITY = 70             # JPEG quality of the re-encoded thumbnail
+MAX_PHOTO_BYTES = 5 * 1024 * 1024  # refuse to download anything bigger than this
+MAX_PHOTO_PIXELS = 4096 * 4096     # refuse to decode anything bigger than this
+MAX_CONCURRENT_PHOTOS = 4          # photos held in memory at the same time
+UPLOAD_CACHE_SIZE = 256            # file_unique_id -> photo_url entries we remember
+
+# Bounds how many photos are downloaded/decoded at once, so a burst of images
+# costs at most MAX_CONCURRENT_PHOTOS * MAX_PHOTO_BYTES of raw buffers.
+_photo_slots = asyncio.Semaphore(MAX_CONCURRENT_PHOTOS)
+
+# Pillow's own decompression-bomb guard, kept in line with our pixel cap
+Image.MAX_IMAGE_PIXELS = MAX_PHOTO_PIXELS
+
+# Finished uploads (LRU) and uploads still in flight, both keyed by file_unique_id
+_uploaded = OrderedDict()
+_in_flight = {}
+
+
+# ===============================================
+# 🔧 Upload Endpoint
+# ===============================================
+def photo_upload_url():
+    """
+    Backend endpoint that stores report photos, or None when unset.
+    Read on every call so a value from .env (loaded by main) is picked up.
+    """
+    return os.getenv("PHOTO_UPLOAD_URL") or None
+
+
+# ===============================================
+# 📐 Pick the Telegram Photo Size
+# ===============================================
+def pick_photo_size(photo_sizes):
+    """
+    Return the smallest PhotoSize whose longest side reaches TARGET_SIDE,
+    matching how make_thumbnail fits the image.
+    Sizes known to exceed MAX_PHOTO_BYTES are ignored; falls back to the
+    largest remaining size, or None when every size is too big.
+    """
+    sizes = sorted(
+        (p for p in photo_sizes if not p.file_size or p.file_size <= MAX_PHOTO_BYTES),
+        key=lambda p: p.width * p.height,
+    )
+    if not sizes:
+        return None
+    for size in sizes:
+        if max(size.width, size.height) >= TARGET_SIDE:
+            return size
+    return sizes[-1]
+
+
+# ===============================================
+# ⬇️ Download with a Byte Limit
+# ===============================================
+def download_limited(url: str, limit: int = MAX_PHOTO_BYTES) -> bytes:
+    """Stream `url` into memory, aborting once more than `limit` bytes arrive."""
+    buf = io.BytesIO()
+    with requests.get(url, stream=True, timeout=10) as resp:
+        resp.raise_for_status()
+        for chunk in resp.iter_content(chunk_size=64 * 1024):
+            if buf.tell() + len(chunk) > limit:
+                raise ValueError(f"Photo exceeds {limit} bytes")
+            buf.write(chunk)
+    return buf.getvalue()
+
+
+# ===============================================
+# 🖼️ Re-encode to a Compact Thumbnail
+# ===============================================
+def make_thumbnail(raw: bytes) -> bytes:
+    """Downscale the image to fit TARGET_SIDE and re-encode it as JPEG."""
+    with Image.open(io.BytesIO(raw)) as img:
+        if img.width * img.height > MAX_PHOTO_PIXELS:
+            raise ValueError(f"Photo is {img.width}x{img.height}, over the pixel limit")
+        # Let the JPEG decoder skip detail we are about to throw away anyway
+        img.draft("RGB", (TARGET_SIDE, TARGET_SIDE))
+        img = img.convert("RGB")
+        img.thumbnail((TARGET_SIDE, TARGET_SIDE))
+        out = io.BytesIO()
+        img.save(out, format="JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+    return out.getvalue()
+
+
+# ===============================================
+# ☁️ Upload to the Backend
+# ===============================================
+def upload_thumbnail(url: str, thumb: bytes, file_unique_id: str, headers: dict):
+    """POST the thumbnail to `url` and return its public URL (or None)."""
+    # The auth header carries a JSON content type; multipart sets its own
+    upload_headers = {k: v for k, v in headers.items() if k != "Content-Type"}
+    files = {"photo": (f"{file_unique_id}.jpg", thumb, "image/jpeg")}
+    try:
+        resp = requests.post(url, headers=upload_headers, files=files, timeout=10)
+        if resp.status_code in [200, 201]:
+            body = resp.json()
+            return body.get("photo_url") or body.get("url")
+        logging.error(f"Photo upload failed (status {resp.status_code}): {resp.text[:200]}")
+    except Exception as e:
+        logging.error(f"Photo upload error: {e}")
+    return None
+
+
+async def _download_and_upload(url: str, photo, headers: dict):
+    async with _photo_slots:
+        tg_file = await photo.get_file()
+        if tg_file.file_size and tg_file.file_size > MAX_PHOTO_BYTES:
+            raise ValueError(f"Photo is {tg_file.file_size} bytes, over the limit")
+        raw = await asyncio.to_thread(download_limited, tg_file.file_path)
+        thumb = await asyncio.to_thread(make_thumbnail, raw)
+        del raw
+    return await asyncio.to_thread(upload_thumbnail, url, thumb, photo.file_unique_id, headers)
+
+
+# ===============================================
+# 🚀 Entry Point for Handlers
+# ===============================================
+async def fetch_photo_url(photo_sizes, headers: dict):
+    """
+    Download, shrink and upload the best-fitting size of a Telegram photo.
+    Photos are deduplicated by file_unique_id; returns the URL or None,
+    including when PHOTO_UPLOAD_URL isn't configured.
+    """
+    upload_url = photo_upload_url()
+    if not upload_url:
+        return None
+
+    photo = pick_photo_size(photo_sizes)
+    if photo is None:
+        logging.warning("Skipping photo: every size exceeds the byte limit")
+        return None
+    key = photo.file_unique_id
+
+    if key in _uploaded:
+        _uploaded.move_to_end(key)
+        return _uploaded[key]
+
+    # Someone else is already uploading this exact photo, wait for their result
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_download_and_upload(upload_url, photo, headers))
+        _in_flight[key] = task
+    try:
+        url = await asyncio.shield(task)
+    except Exception as e:
+        logging.error(f"Photo pipeline error: {e}")
+        return None
+    finally:
+        if task.done():
+            _in_flight.pop(key, None)
+
+    if url:
+        _uploaded[key] = url
+        if len(_uploaded) > UPLOAD_CACHE_SIZE:
+            _uploaded.popitem(last=False)
+    return url
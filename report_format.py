@@ -0,0 +1,112 @@
+import asyncio, json, logging, os
+from collections import OrderedDict
+
+# ===============================================
+# 🧾 Report Formatting Settings
+# ===============================================
+REPORT_CACHE_SIZE = 1024
+REQUIRED_FIELDS = ("problem_type", "disability_types", "severity", "description", "status")
+
+# Set by main once Gemini is configured (a gemini_client.GeminiClient)
+gemini_client = None
+
+# Localized reports (LRU) and localized calls still in flight, both keyed by
+# (user text, lat, lon, language)
+_reports = OrderedDict()
+_in_flight = {}
+
+
+def localize_descriptions_enabled() -> bool:
+    """Read on every call so a value from .env (loaded by main) is picked up."""
+    return os.getenv("LOCALIZE_DESCRIPTIONS", "false").lower() == "true"
+
+
+# ============================================================
+# Gemini: Convert report text to JSON
+# ============================================================
+async def format_report_with_gemini(user_text: str, lat: float = 0.0, lon: float = 0.0,
+                                    lang: str = "english") -> dict | None:
+    """
+    Generate structured JSON using Gemini.
+    With LOCALIZE_DESCRIPTIONS on and a non-English `lang`, the same call also
+    returns `description_localized`. Those localized results (and calls still
+    in flight) are cached on the user's input, so the same text never goes to
+    Gemini twice; the plain English path is not cached.
+    """
+    if not localize_descriptions_enabled() or lang == "english":
+        return await _generate_report(user_text, lat, lon, None)
+
+    key = (user_text, lat, lon, lang)
+    if key in _reports:
+        _reports.move_to_end(key)
+        return dict(_reports[key])
+
+    # Someone else is already formatting this exact report, wait for their result
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_generate_report(user_text, lat, lon, lang))
+        _in_flight[key] = task
+    try:
+        report = await asyncio.shield(task)
+    finally:
+        if task.done():
+            _in_flight.pop(key, None)
+
+    if report is None:
+        return None
+    # Never keep serving an incomplete answer to identical resubmissions
+    if all(report.get(field) for field in REQUIRED_FIELDS + ("description_localized",)):
+        _reports[key] = report
+        if len(_reports) > REPORT_CACHE_SIZE:
+            _reports.popitem(last=False)
+    return dict(report)
+
+
+async def _generate_report(user_text: str, lat: float, lon: float, lang: str | None) -> dict | None:
+    localized_field = '"description_localized": <string>,' if lang else ""
+    localized_rule = (
+        f"- Write description in English and description_localized in {lang} "
+        "(Hinglish means Hindi written in Latin script)."
+        if lang else ""
+    )
+    prompt = f"""
+    You are a strict JSON generator for a Django backend model called AccessibilityReport.
+
+    Convert the user’s message into valid JSON with these fields:
+    {{
+      "latitude": <float>,  
+      "longitude": <float>, 
+      "problem_type": <string>,  
+      "disability_types": <list of strings>, 
+      "severity": <string>,  
+      "description": <string>, 
+      {localized_field}
+      "photo_url": <string or null>,  
+      "status": <string>
+    }}
+
+    Rules:
+    - Output only valid JSON, no markdown or text.
+    - Use provided coordinates if available: latitude={lat}, longitude={lon}.
+    - Default severity='Medium', photo_url=null, status='Active'.
+    {localized_rule}
+
+    User report: "{user_text}"
+    """
+
+    try:
+        text = await gemini_client.generate(prompt)
+        raw = text.strip().strip("```json").strip("```").strip()
+        return json.loads(raw)
+    except Exception as e:
+        logging.error(f"Gemini JSON error: {e}")
+        return None
+
+
+def split_localized(report: dict):
+    """
+    Return (backend payload, localized description or None).
+    The localized description is only for the user; the backend stays English.
+    """
+    payload = dict(report)
+    return payload, payload.pop("description_localized", None)
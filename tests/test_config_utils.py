@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+import config_utils
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_utils, "CONFIG_PATH", str(tmp_path / "config.json"))
+    monkeypatch.setattr(config_utils, "USER_LANGUAGES_FILE", str(tmp_path / "user_languages.json"))
+    monkeypatch.setattr(config_utils, "_config", None)
+    monkeypatch.setattr(config_utils, "_user_languages", None)
+    (tmp_path / "config.json").write_text(json.dumps({"language": "english"}))
+    return tmp_path
+
+
+def test_user_language_overrides_default(isolated_config):
+    config_utils.set_language("hindi", 42)
+
+    assert config_utils.get_language(42) == "hindi"
+    assert config_utils.get_language(7) == "english"
+    assert config_utils.get_language() == "english"
+
+
+def test_user_language_is_written_outside_config(isolated_config):
+    config_utils.set_language("hinglish", 42)
+
+    assert json.loads((isolated_config / "user_languages.json").read_text()) == {"42": "hinglish"}
+    assert json.loads((isolated_config / "config.json").read_text()) == {"language": "english"}
+
+
+def test_user_language_survives_reload(isolated_config):
+    config_utils.set_language("hindi", 42)
+    config_utils._config = None
+
+    assert config_utils.get_language(42) == "hindi"
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from gemini_client import GeminiClient, MIN_SAMPLES
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """
+    Async backend that replays a script of delays (seconds) or exceptions.
+    Replies with `reply` when given, else with "<name>:<call number>".
+    """
+
+    def __init__(self, name, script, reply=None):
+        self.model_name = name
+        self.script = list(script)
+        self.reply = reply
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        call = self.calls
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        try:
+            await asyncio.sleep(step)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return FakeResponse(self.reply or f"{self.model_name}:{call}")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_slow_call_is_hedged_and_loser_cancelled():
+    model = FakeModel("flash", [1.0, 0.01])
+    client = GeminiClient([model], default_hedge_delay=0.05)
+
+    async def scenario():
+        text = await client.generate("report")
+        await asyncio.sleep(0)  # let the cancelled loser unwind
+        return text
+
+    assert run(scenario()) == "flash:2"
+    assert model.calls == 2
+    assert model.cancelled == 1
+
+
+def test_hedge_goes_to_next_model():
+    primary = FakeModel("flash", [1.0])
+    backup = FakeModel("flash-lite", [0.01])
+    client = GeminiClient([primary, backup], default_hedge_delay=0.05)
+
+    assert run(client.generate("report")) == "flash-lite:1"
+    assert primary.cancelled == 1
+
+
+def test_fast_call_does_not_hedge():
+    model = FakeModel("flash", [0.01])
+    client = GeminiClient([model], default_hedge_delay=0.5)
+
+    assert run(client.generate("report")) == "flash:1"
+    assert model.calls == 1
+
+
+def test_error_falls_through_to_next_model():
+    broken = FakeModel("flash", [ValueError("boom")])
+    backup = FakeModel("flash-lite", [0.01])
+    client = GeminiClient([broken, backup])
+
+    assert run(client.generate("report")) == "flash-lite:1"
+
+
+def test_all_models_failing_raises():
+    client = GeminiClient([
+        FakeModel("flash", [ValueError("boom")]),
+        FakeModel("flash-lite", [ValueError("boom")]),
+    ])
+
+    with pytest.raises(RuntimeError):
+        run(client.generate("report"))
+
+
+def test_cancelled_loser_latency_is_recorded():
+    model = FakeModel("flash", [1.0, 0.01])
+    client = GeminiClient([model], default_hedge_delay=0.05)
+
+    async def scenario():
+        await client.generate("report")
+        await asyncio.sleep(0)
+
+    run(scenario())
+    samples = client.latency["flash"].samples
+    assert len(samples) == 2
+    assert max(samples) >= 0.05  # the cancelled original ran until the hedge won
+
+
+def test_hedge_rate_is_capped():
+    model = FakeModel("flash", [])
+    client = GeminiClient([model], max_hedge_rate=0.1)
+    tracker = client.latency["flash"]
+    for _ in range(MIN_SAMPLES):
+        tracker.record_hedge(True)
+
+    assert client.hedge_delay(model) is None
+
+
+def test_cancelled_hedge_latency_is_not_recorded():
+    model = FakeModel("flash", [0.08, 1.0])
+    client = GeminiClient([model], default_hedge_delay=0.05)
+
+    async def scenario():
+        text = await client.generate("report")
+        await asyncio.sleep(0)
+        return text
+
+    assert run(scenario()) == "flash:1"
+    assert model.cancelled == 1
+    samples = list(client.latency["flash"].samples)
+    assert len(samples) == 1
+    assert samples[0] >= 0.08
+
+
+def test_failed_hedge_model_is_not_called_again():
+    primary = FakeModel("flash", [1.0])
+    backup = FakeModel("flash-lite", [ValueError("boom")])
+    last = FakeModel("pro", [0.01])
+    client = GeminiClient([primary, backup, last], default_hedge_delay=0.05, timeout=0.2)
+
+    assert run(client.generate("report")) == "pro:1"
+    assert backup.calls == 1
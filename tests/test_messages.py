@@ -0,0 +1,26 @@
+import pytest
+
+from messages import compile_catalog, render
+
+
+def test_compile_rejects_missing_english():
+    with pytest.raises(ValueError):
+        compile_catalog({"greeting": {"hindi": "नमस्ते"}})
+
+
+def test_compile_rejects_mismatched_placeholders():
+    with pytest.raises(ValueError):
+        compile_catalog({"greeting": {"english": "Hi {name}", "hindi": "नमस्ते {user}"}})
+
+
+def test_compile_fills_missing_languages_with_english():
+    catalog = compile_catalog({"greeting": {"english": "Hi {name}"}})
+    assert catalog[("greeting", "hinglish")] == "Hi {name}"
+
+
+def test_render_uses_user_language():
+    assert render("reg_success", "hinglish", username="asha").startswith("🎉 Registration ho gaya!")
+
+
+def test_render_falls_back_to_english_for_unknown_language():
+    assert render("reg_success", "klingon", username="asha") == render("reg_success", "english", username="asha")
@@ -0,0 +1,141 @@
+import asyncio, io
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+import photo_mode
+
+
+def size(width, height, file_size=None, uid="photo"):
+    return SimpleNamespace(width=width, height=height, file_size=file_size, file_unique_id=uid)
+
+
+def jpeg(width, height):
+    out = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(out, format="JPEG")
+    return out.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(photo_mode, "_uploaded", photo_mode.OrderedDict())
+    monkeypatch.setattr(photo_mode, "_in_flight", {})
+
+
+# ===============================================
+# pick_photo_size
+# ===============================================
+def test_picks_smallest_size_reaching_target():
+    sizes = [size(90, 67), size(320, 240), size(800, 600), size(1280, 960)]
+    assert photo_mode.pick_photo_size(sizes).width == 800
+
+
+def test_skips_sizes_over_byte_cap():
+    cap = photo_mode.MAX_PHOTO_BYTES
+    sizes = [size(320, 240, 10_000), size(800, 600, cap + 1), size(1280, 960, cap + 2)]
+    assert photo_mode.pick_photo_size(sizes).width == 320
+
+
+def test_returns_none_when_every_size_is_too_big():
+    cap = photo_mode.MAX_PHOTO_BYTES
+    assert photo_mode.pick_photo_size([size(800, 600, cap + 1)]) is None
+
+
+# ===============================================
+# download_limited
+# ===============================================
+class FakeStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        yield from self.chunks
+
+
+def test_download_aborts_past_byte_limit(monkeypatch):
+    monkeypatch.setattr(photo_mode.requests, "get", lambda *a, **kw: FakeStream([b"x" * 60] * 3))
+    with pytest.raises(ValueError):
+        photo_mode.download_limited("https://example.test/photo.jpg", limit=100)
+
+
+def test_download_within_limit(monkeypatch):
+    monkeypatch.setattr(photo_mode.requests, "get", lambda *a, **kw: FakeStream([b"x" * 40] * 2))
+    assert photo_mode.download_limited("https://example.test/photo.jpg", limit=100) == b"x" * 80
+
+
+# ===============================================
+# make_thumbnail
+# ===============================================
+def test_thumbnail_fits_target_side():
+    thumb = Image.open(io.BytesIO(photo_mode.make_thumbnail(jpeg(1280, 960))))
+    assert max(thumb.size) == photo_mode.TARGET_SIDE
+
+
+def test_thumbnail_rejects_images_over_pixel_cap(monkeypatch):
+    monkeypatch.setattr(photo_mode, "MAX_PHOTO_PIXELS", 100 * 100)
+    with pytest.raises(ValueError):
+        photo_mode.make_thumbnail(jpeg(200, 200))
+
+
+# ===============================================
+# fetch_photo_url
+# ===============================================
+class FakePhoto(SimpleNamespace):
+    async def get_file(self):
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(file_size=None, file_path="https://example.test/photo.jpg")
+
+
+def test_concurrent_duplicates_upload_once(monkeypatch):
+    uploads = []
+    monkeypatch.setenv("PHOTO_UPLOAD_URL", "https://example.test/upload/")
+    monkeypatch.setattr(photo_mode, "download_limited", lambda url: jpeg(800, 600))
+
+    def fake_upload(url, thumb, uid, headers):
+        uploads.append(uid)
+        return f"https://cdn.test/{uid}.jpg"
+
+    monkeypatch.setattr(photo_mode, "upload_thumbnail", fake_upload)
+    photo = [FakePhoto(width=800, height=600, file_size=None, file_unique_id="abc")]
+
+    async def scenario():
+        monkeypatch.setattr(photo_mode, "_photo_slots", asyncio.Semaphore(1))
+        return await asyncio.gather(
+            photo_mode.fetch_photo_url(photo, {}),
+            photo_mode.fetch_photo_url(photo, {}),
+        )
+
+    assert asyncio.run(scenario()) == ["https://cdn.test/abc.jpg"] * 2
+    assert uploads == ["abc"]
+
+
+def test_failure_returns_none(monkeypatch):
+    monkeypatch.setenv("PHOTO_UPLOAD_URL", "https://example.test/upload/")
+
+    def broken_download(url):
+        raise ValueError("Photo exceeds limit")
+
+    monkeypatch.setattr(photo_mode, "download_limited", broken_download)
+    photo = [FakePhoto(width=800, height=600, file_size=None, file_unique_id="abc")]
+
+    async def scenario():
+        monkeypatch.setattr(photo_mode, "_photo_slots", asyncio.Semaphore(1))
+        return await photo_mode.fetch_photo_url(photo, {})
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_no_upload_url_skips_photo(monkeypatch):
+    monkeypatch.delenv("PHOTO_UPLOAD_URL", raising=False)
+    photo = [FakePhoto(width=800, height=600, file_size=None, file_unique_id="abc")]
+    assert asyncio.run(photo_mode.fetch_photo_url(photo, {})) is None
@@ -0,0 +1,100 @@
+import asyncio, json
+
+import pytest
+
+import report_format
+from gemini_client import GeminiClient
+from test_gemini_client import FakeModel
+
+REPORT = {
+    "latitude": 28.61,
+    "longitude": 77.21,
+    "problem_type": "Broken ramp",
+    "disability_types": ["wheelchair"],
+    "severity": "Medium",
+    "description": "Broken wheelchair ramp at the entrance",
+    "description_localized": "प्रवेश द्वार पर व्हीलचेयर रैंप टूटा है",
+    "photo_url": None,
+    "status": "Active",
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(report_format, "_reports", report_format.OrderedDict())
+    monkeypatch.setattr(report_format, "_in_flight", {})
+    monkeypatch.setenv("LOCALIZE_DESCRIPTIONS", "true")
+
+
+def use_model(monkeypatch, script, reply=REPORT):
+    model = FakeModel("flash", script, reply=json.dumps(reply))
+    monkeypatch.setattr(report_format, "gemini_client", GeminiClient([model]))
+    return model
+
+
+def test_repeated_localized_input_reaches_gemini_once(monkeypatch):
+    model = use_model(monkeypatch, [0.01])
+
+    async def scenario():
+        first = await report_format.format_report_with_gemini("ramp broken", 28.61, 77.21, "hindi")
+        second = await report_format.format_report_with_gemini("ramp broken", 28.61, 77.21, "hindi")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == second == REPORT
+    assert model.calls == 1
+
+
+def test_concurrent_localized_input_reaches_gemini_once(monkeypatch):
+    model = use_model(monkeypatch, [0.05])
+
+    async def scenario():
+        return await asyncio.gather(*(
+            report_format.format_report_with_gemini("ramp broken", 28.61, 77.21, "hindi")
+            for _ in range(3)
+        ))
+
+    assert asyncio.run(scenario()) == [REPORT] * 3
+    assert model.calls == 1
+
+
+def test_english_reports_are_not_cached(monkeypatch):
+    model = use_model(monkeypatch, [0.01, 0.01])
+
+    async def scenario():
+        for _ in range(2):
+            await report_format.format_report_with_gemini("ramp broken", 28.61, 77.21, "english")
+
+    asyncio.run(scenario())
+    assert model.calls == 2
+
+
+def test_incomplete_localized_result_is_not_cached(monkeypatch):
+    partial = {k: v for k, v in REPORT.items() if k != "description_localized"}
+    model = use_model(monkeypatch, [0.01, 0.01], reply=partial)
+
+    async def scenario():
+        for _ in range(2):
+            await report_format.format_report_with_gemini("ramp broken", 28.61, 77.21, "hindi")
+
+    asyncio.run(scenario())
+    assert model.calls == 2
+
+
+def test_cached_report_is_a_copy(monkeypatch):
+    use_model(monkeypatch, [0.01])
+
+    async def scenario():
+        report = await report_format.format_report_with_gemini("ramp broken", 28.61, 77.21, "hindi")
+        report["photo_url"] = "https://cdn.test/a.jpg"
+        return await report_format.format_report_with_gemini("ramp broken", 28.61, 77.21, "hindi")
+
+    assert asyncio.run(scenario())["photo_url"] is None
+
+
+def test_localized_description_is_kept_out_of_backend_payload():
+    payload, localized = report_format.split_localized(REPORT)
+
+    assert "description_localized" not in payload
+    assert payload["description"] == REPORT["description"]
+    assert localized == REPORT["description_localized"]